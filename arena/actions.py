@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillAction:
     """Executes a :class:`~arena.skills.Skill` for a combatant."""
 
@@ -14,7 +14,8 @@ class SkillAction:
     def execute(self, context: "BattleContext") -> None:
         if not self.user.alive:
             return
-        context.log_event(f"{self.user.name} usa {self.skill.name}")
+        if context.log_enabled:
+            context.log_event(f"{self.user.name} usa {self.skill.name}")
         self.skill.execute(self.user, context)
 
 
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from . import constants
+from .actions import SkillAction
 
 
 @dataclass
@@ -19,29 +20,30 @@ class AutonomousAI:
 
     owner: "Combatant"
 
-    def choose_action(self, context: "BattleContext") -> "SkillAction":
-        from .actions import SkillAction
-
+    def choose_action(self, context: "BattleContext") -> SkillAction:
         available = self.owner.available_skills()
         if not available:
             raise RuntimeError(f"{self.owner.name} has no skills to use")
 
+        # The owner caches its heal/buff/damage partitions; we only need to
+        # filter them by what is usable this turn.
+        ready = {skill.name for skill in available}
+
         # Try to heal if allies are low.
-        heal_skills = [skill for skill in available if "heal" in skill.name.lower()]
+        heal_skill = next((skill for skill in self.owner._heal_skills if skill.name in ready), None)
         ally = context.pick_ally_to_heal(self.owner)
-        if ally and ally.hp / ally.dynamic_stats.get("hp") < 0.4 and heal_skills:
-            return SkillAction(self.owner, heal_skills[0])
+        if ally and ally.hp / ally.dynamic_stats.get("hp") < 0.4 and heal_skill:
+            return SkillAction(self.owner, heal_skill)
 
         # Buff if starting fight.
-        buff_skills = [skill for skill in available if "buff" in skill.name.lower()]
-        if buff_skills and context.turn_number < 3:
-            return SkillAction(self.owner, buff_skills[0])
+        buff_skill = next((skill for skill in self.owner._buff_skills if skill.name in ready), None)
+        if buff_skill and context.turn_number < 3:
+            return SkillAction(self.owner, buff_skill)
 
         # Otherwise pick the skill with the highest power attribute.
-        damaging = [skill for skill in available if hasattr(skill, "power")]
-        if damaging:
-            damaging.sort(key=lambda sk: getattr(sk, "power", 1.0), reverse=True)
-            return SkillAction(self.owner, damaging[0])
+        for skill in self.owner._damaging_skills_sorted:
+            if skill.name in ready:
+                return SkillAction(self.owner, skill)
 
         return SkillAction(self.owner, available[0])
 
@@ -49,6 +51,5 @@ class AutonomousAI:
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .actions import SkillAction
     from .battle import BattleContext
     from .combatant import Combatant
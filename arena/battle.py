@@ -2,17 +2,59 @@
 from __future__ import annotations
 
 import random
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Deque, Iterator, List, Optional
 
 from . import constants
 from .actions import SkillAction
 from .battlefield import Battlefield
 from .combatant import Combatant, Team
 from .events import EventManager
+from .stats import STAT_INDEX
 from .timeline import Timeline
 
 
+# Offensive/defensive stat indices used by each damage type. Any type not
+# listed here is treated as magical.
+_STAT_KEYS = {
+    "physical": (STAT_INDEX["atk"], STAT_INDEX["defense"]),
+    "true": (STAT_INDEX["atk"], STAT_INDEX["resistance"]),
+}
+_DEFAULT_STAT_KEYS = (STAT_INDEX["mag"], STAT_INDEX["resistance"])
+_CRIT_CHANCE = STAT_INDEX["crit_chance"]
+_CRIT_DAMAGE = STAT_INDEX["crit_damage"]
+_MAX_HP = STAT_INDEX["hp"]
+
+
+def _damage_kernel(
+    base: float,
+    defense: float,
+    power: float,
+    field_mod: float,
+    weak_sum: float,
+    resist_sum: float,
+    crit_chance: float,
+    crit_damage: float,
+    rnd: float,
+) -> tuple[float, bool]:
+    """Numeric core of the damage formula.
+
+    Only takes plain floats so it stays free of attribute lookups and can
+    be swapped for a compiled implementation without touching callers.
+    ``rnd`` is the pre-drawn uniform sample used for the critical roll.
+    """
+
+    mitigation = 100.0 / (100.0 + defense)
+    if mitigation < 0.1:
+        mitigation = 0.1
+    damage = base * power * mitigation * (1.0 + field_mod + weak_sum - resist_sum)
+    is_crit = rnd < crit_chance
+    if is_crit:
+        damage *= crit_damage
+    return damage, is_crit
+
+
 @dataclass
 class BattleContext:
     """Runtime object passed to skills and AI with battle-wide data."""
@@ -23,16 +65,29 @@ class BattleContext:
     def turn_number(self) -> int:
         return self.battle.turn_number
 
+    @property
+    def rng(self) -> random.Random:
+        return self.battle.rng
+
+    @property
+    def log_enabled(self) -> bool:
+        """Whether log messages are kept; lets callers skip formatting them."""
+        return self.battle.log_messages is not None
+
     def pick_enemy_target(self, requester: Combatant) -> Optional[Combatant]:
         enemies = self.battle.enemies_of(requester)
         alive = [c for c in enemies if c.alive]
-        return random.choice(alive) if alive else None
+        return self.battle.rng.choice(alive) if alive else None
 
     def pick_ally_to_heal(self, requester: Combatant) -> Optional[Combatant]:
-        allies = self.battle.allies_of(requester)
-        if not allies:
-            return None
-        return min(allies, key=lambda ally: ally.hp / max(ally.dynamic_stats.get("hp"), 1))
+        best: Optional[Combatant] = None
+        best_ratio = 0.0
+        for ally in self.battle.allies_of(requester):
+            max_hp = ally.dynamic_stats.get_at(_MAX_HP)
+            ratio = ally.hp / (max_hp if max_hp > 1 else 1)
+            if best is None or ratio < best_ratio:
+                best, best_ratio = ally, ratio
+        return best
 
     def compute_damage(
         self,
@@ -42,23 +97,27 @@ class BattleContext:
         damage_type: str,
         tags: List[str],
     ) -> tuple[float, bool]:
-        base_stat = attacker.dynamic_stats.get("atk") if damage_type in {"physical", "true"} else attacker.dynamic_stats.get("mag")
-        defense = defender.dynamic_stats.get("defense") if damage_type in {"physical"} else defender.dynamic_stats.get("resistance")
-        mitigation = max(0.1, 100.0 / (100.0 + defense))
-        damage = base_stat * power * mitigation
-        modifier = 1.0 + self.battle.battlefield.query_modifier(damage_type)
+        attack_key, defense_key = _STAT_KEYS.get(damage_type, _DEFAULT_STAT_KEYS)
+        attacker_stat = attacker.dynamic_stats.get_at
+        weak_sum = 0.0
+        resist_sum = 0.0
         if tags:
             for tag in tags:
                 if defender.has_tag(tag + "_weak"):
-                    modifier += 0.25
+                    weak_sum += 0.25
                 if defender.has_tag(tag + "_resist"):
-                    modifier -= 0.25
-        damage *= modifier
-        crit_chance = attacker.dynamic_stats.get("crit_chance")
-        is_crit = random.random() < crit_chance
-        if is_crit:
-            damage *= attacker.dynamic_stats.get("crit_damage")
-        return damage, is_crit
+                    resist_sum += 0.25
+        return _damage_kernel(
+            attacker_stat(attack_key),
+            defender.dynamic_stats.get_at(defense_key),
+            power,
+            self.battle.battlefield.query_modifier(damage_type),
+            weak_sum,
+            resist_sum,
+            attacker_stat(_CRIT_CHANCE),
+            attacker_stat(_CRIT_DAMAGE),
+            self.battle.uniform(),
+        )
 
     def allies_of(self, requester: Combatant) -> List[Combatant]:
         return self.battle.allies_of(requester)
@@ -73,24 +132,53 @@ class BattleContext:
 class Battle:
     """Controls the lifecycle of a combat scenario."""
 
-    def __init__(self, team_a: Team, team_b: Team, *, manager: Optional[EventManager] = None) -> None:
+    def __init__(self, team_a: Team, team_b: Team, *, manager: Optional[EventManager] = None,
+                 seed: Optional[int] = None, log_enabled: bool = True,
+                 log_maxlen: Optional[int] = 1024) -> None:
         self.manager = manager or EventManager()
+        # Battle-local generator so simulations can be replayed from a seed.
+        # Exposed read-only as :attr:`rng` so ``uniform`` always draws from
+        # the same stream as target picks.
+        self._rng = random.Random(seed)
+        # Bound once: damage rolls draw uniform samples through this
+        # attribute instead of resolving ``rng.random`` per call.
+        self.uniform = self._rng.random
         self.team_a = team_a
         self.team_b = team_b
+        team_a.action_event = constants.ON_ALLY_ACTION
+        team_b.action_event = constants.ON_ENEMY_ACTION
         self.timeline = Timeline()
         self.turn_number = 0
         self.time = 0.0
         self.battlefield = Battlefield(self.manager)
-        self.log_messages: List[str] = []
+        # Only the most recent ``log_maxlen`` messages are kept; headless
+        # simulations can disable logging altogether.
+        self.log_messages: Optional[Deque[str]] = deque(maxlen=log_maxlen) if log_enabled else None
+        self._all_members: List[Combatant] = team_a.members + team_b.members
 
-        for combatant in team_a.members + team_b.members:
+        self.timeline.add_many(self._enter_battle())
+
+    def _enter_battle(self) -> Iterator[Combatant]:
+        """Wire each combatant to the battle and announce its entry.
+
+        Consumed lazily by :meth:`Timeline.add_many`, so every combatant is
+        scheduled before its ``ON_ENTER_BATTLE`` fires and its entry
+        listeners still run before the next combatant is scheduled.
+        """
+
+        for combatant in self._all_members:
             combatant.event_manager = self.manager
             combatant.resource_pool.manager = self.manager
-            self.timeline.add_combatant(combatant)
+            yield combatant
             self.manager.broadcast(constants.ON_ENTER_BATTLE, source=combatant)
 
+    @property
+    def rng(self) -> random.Random:
+        return self._rng
+
     def log(self, message: str) -> None:
-        self.log_messages.append(message)
+        if self.log_messages is not None:
+            self.log_messages.append(message)
 
     # --- Queries --------------------------------------------------------
     def allies_of(self, requester: Combatant) -> List[Combatant]:
@@ -106,12 +194,13 @@ class Battle:
         if team is self.team_b:
             return self.team_a.alive_members()
         # Summons might not belong to either team yet: fallback to all opponents.
-        return [combatant for combatant in self.team_a.members + self.team_b.members if combatant.team is not team]
+        return [combatant for combatant in self._all_members if combatant.team is not team]
 
     def run(self, max_turns: int = 100) -> None:
         context = BattleContext(self)
         while self.turn_number < max_turns and not self.is_finished:
             current_time, combatant = self.timeline.pop_next()
+            # Only reachable when every queued combatant is dead.
             if not combatant.alive:
                 continue
             self.time = current_time
@@ -121,7 +210,8 @@ class Battle:
             combatant.perform_action(action, context)
             combatant.end_turn()
             self.timeline.schedule_next(combatant, current_time=current_time)
-            self.manager.broadcast(constants.ON_ENEMY_ACTION if combatant.team is self.team_b else constants.ON_ALLY_ACTION, source=combatant)
+            team = combatant.team
+            self.manager.broadcast(team.action_event if team else constants.ON_ALLY_ACTION, source=combatant)
             self.battlefield.tick()
         self.manager.broadcast("battle_end", data={"turns": self.turn_number})
 
@@ -134,6 +224,6 @@ class Battle:
             "turns": self.turn_number,
             "team_a_alive": [c.name for c in self.team_a.alive_members()],
             "team_b_alive": [c.name for c in self.team_b.alive_members()],
-            "log": list(self.log_messages),
+            "log": list(self.log_messages or ()),
             "battlefield": self.battlefield.snapshot(),
         }
@@ -1,14 +1,15 @@
 """Battlefield and field effects implementation."""
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import DefaultDict, Dict, List, Optional
 
 from . import constants
 from .events import EventManager
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldEffect:
     """Represents a global or side-specific battlefield modifier."""
 
@@ -34,23 +35,40 @@ class Battlefield:
     def __init__(self, manager: EventManager) -> None:
         self.manager = manager
         self.global_effects: List[FieldEffect] = []
+        # Running per-tag totals of every active effect's modifiers so that
+        # damage calculations read a single dict entry.
+        self._modifier_totals: DefaultDict[str, float] = defaultdict(float)
 
     def add_effect(self, effect: FieldEffect) -> None:
         self.global_effects.append(effect)
         self.global_effects.sort(key=lambda eff: eff.priority, reverse=True)
+        for tag, value in effect.modifiers.items():
+            self._modifier_totals[tag] += value
         effect.on_apply(self.manager)
 
     def tick(self) -> None:
-        for effect in list(self.global_effects):
+        ticking = self.global_effects
+        # Effects applied by listeners while ticking land in a fresh list so
+        # they are kept, and only start ticking on the next pass.
+        self.global_effects = []
+        survivors: List[FieldEffect] = []
+        for effect in ticking:
             effect.on_tick(self.manager)
             effect.duration -= 1
             if effect.duration <= 0:
                 effect.on_expire(self.manager)
-                self.global_effects.remove(effect)
+                for tag, value in effect.modifiers.items():
+                    self._modifier_totals[tag] -= value
+            else:
+                survivors.append(effect)
+        if self.global_effects:
+            survivors.extend(self.global_effects)
+            survivors.sort(key=lambda eff: eff.priority, reverse=True)
+        self.global_effects = survivors
 
     def query_modifier(self, tag: str) -> float:
         """Return the cumulative modifier for a given tag."""
-        return sum(effect.modifiers.get(tag, 0.0) for effect in self.global_effects)
+        return self._modifier_totals.get(tag, 0.0)
 
     def snapshot(self) -> List[Dict[str, any]]:
         return [
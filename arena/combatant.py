@@ -2,16 +2,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from . import constants
+from .ai import AutonomousAI
 from .effects import EffectController, EffectInstance
 from .events import EventManager
 from .resources import ResourcePool
 from .stats import DynamicStats, Stats
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillReference:
     """Lightweight pointer to a skill by name."""
 
@@ -39,12 +40,24 @@ class Combatant:
         self.hp = self.dynamic_stats.get("hp")
         self.skills = list(skills)
         self.skill_cooldowns: Dict[str, int] = {skill.name: 0 for skill in skills}
+        # Names of skills off cooldown and of skills still cooling down, kept
+        # in sync with ``skill_cooldowns`` so turns never rescan the roster.
+        self._ready_skills: Set[str] = set(self.skill_cooldowns)
+        self._cooling: Set[str] = set()
+        self._index_skills()
         self.event_manager = event_manager or EventManager()
         self.effects = EffectController(self, self.dynamic_stats, self.event_manager)
         self.resource_pool = ResourcePool(resources or {}, self.event_manager, owner=self)
         self.alive = True
         self.team: Optional["Team"] = None
         self.ui_state: Dict[str, float] = {}
+        self._ai = AutonomousAI(self)
+        # Bumped by combatant-level mutations (cooldowns, roster, life);
+        # combined with the components' versions to validate the cached
+        # UI snapshot.
+        self._snap_version = 0
+        self._snap_key: Optional[tuple] = None
+        self._snap_cache: Optional[Dict[str, any]] = None
 
     def has_tag(self, tag: str) -> bool:
         return tag in self.tags
@@ -88,25 +101,72 @@ class Combatant:
         if not self.alive:
             return
         self.alive = False
+        self._snap_version += 1
         self.event_manager.broadcast(constants.ON_EXIT_BATTLE, source=self)
         if self.team:
             self.team.handle_death(self)
 
     # --- Skills ---------------------------------------------------------
-    def available_skills(self) -> List["Skill"]:
-        return [
-            skill
+    def _index_skills(self) -> None:
+        """Classify the skill roster once for the AI heuristics.
+
+        The roster rarely changes during a battle, so the heal/buff/damage
+        partitions and the flattened ``(resource, cost)`` pairs checked by
+        :meth:`available_skills` are cached here and only rebuilt by
+        :meth:`add_skill` and :meth:`remove_skill`.
+        """
+
+        names = [(skill, skill.name.lower()) for skill in self.skills]
+        self._heal_skills = [skill for skill, name in names if "heal" in name]
+        self._buff_skills = [skill for skill, name in names if "buff" in name]
+        self._skill_costs: List[Tuple["Skill", Tuple[Tuple[str, float], ...]]] = [
+            (skill, tuple((name, float(cost)) for name, cost in skill.costs.items()))
             for skill in self.skills
-            if self.skill_cooldowns[skill.name] == 0 and self.resource_pool.can_pay(skill.costs)
         ]
+        self._damaging_skills_sorted = sorted(
+            (skill for skill in self.skills if hasattr(skill, "power")),
+            key=lambda sk: getattr(sk, "power", 1.0),
+            reverse=True,
+        )
+
+    def add_skill(self, skill: "Skill") -> None:
+        self.skills.append(skill)
+        if self.skill_cooldowns.setdefault(skill.name, 0) == 0:
+            self._ready_skills.add(skill.name)
+        self._index_skills()
+        self._snap_version += 1
+
+    def remove_skill(self, name: str) -> None:
+        self.skills = [skill for skill in self.skills if skill.name != name]
+        self.skill_cooldowns.pop(name, None)
+        self._ready_skills.discard(name)
+        self._cooling.discard(name)
+        self._index_skills()
+        self._snap_version += 1
+
+    def available_skills(self) -> List["Skill"]:
+        ready = self._ready_skills
+        can_pay = self.resource_pool.can_pay_pairs
+        return [skill for skill, costs in self._skill_costs if skill.name in ready and can_pay(costs)]
 
     def start_cooldown(self, skill: "Skill") -> None:
         self.skill_cooldowns[skill.name] = skill.cooldown
+        self._snap_version += 1
+        if skill.cooldown > 0:
+            self._ready_skills.discard(skill.name)
+            self._cooling.add(skill.name)
 
     def reduce_cooldowns(self) -> None:
-        for name in list(self.skill_cooldowns.keys()):
-            if self.skill_cooldowns[name] > 0:
-                self.skill_cooldowns[name] -= 1
+        if not self._cooling:
+            return
+        self._snap_version += 1
+        cooldowns = self.skill_cooldowns
+        for name in list(self._cooling):
+            cooldowns[name] -= 1
+            if cooldowns[name] <= 0:
+                cooldowns[name] = 0
+                self._cooling.discard(name)
+                self._ready_skills.add(name)
 
     # --- Effects --------------------------------------------------------
     def apply_effect(self, effect: EffectInstance) -> None:
@@ -128,27 +188,41 @@ class Combatant:
 
     # --- AI -------------------------------------------------------------
     def choose_action(self, context: "BattleContext") -> "SkillAction":
-        from .ai import AutonomousAI
-
-        ai = AutonomousAI(self)
-        return ai.choose_action(context)
+        return self._ai.choose_action(context)
 
     def perform_action(self, action: "SkillAction", context: "BattleContext") -> None:
         action.execute(context)
 
     # --- UI -------------------------------------------------------------
     def snapshot(self) -> Dict[str, any]:
-        """Collect info for UI overlays."""
-        return {
-            "name": self.name,
-            "hp": self.hp,
-            "max_hp": self.dynamic_stats.get("hp"),
-            "stats": self.dynamic_stats.as_dict(),
-            "tags": list(self.tags),
-            "effects": self.effects.summary(),
-            "resources": self.resource_pool.summary(),
-            "cooldowns": dict(self.skill_cooldowns),
-        }
+        """Collect info for UI overlays.
+
+        The stats, effects, resources and cooldowns entries are cached until
+        the combatant or its stats, effects or resources change, so callers
+        must treat them as read-only. Resource values only count as changed
+        when they go through :class:`ResourcePool`. The outer dict and
+        ``"tags"`` are rebuilt on every call.
+        """
+        key = (
+            self._snap_version,
+            self.hp,
+            self.dynamic_stats.version,
+            self.effects.version,
+            self.resource_pool.version,
+        )
+        if key != self._snap_key:
+            self._snap_key = key
+            self._snap_cache = {
+                "name": self.name,
+                "hp": self.hp,
+                "max_hp": self.dynamic_stats.get("hp"),
+                "stats": self.dynamic_stats.as_dict(),
+                "tags": None,
+                "effects": self.effects.summary(),
+                "resources": self.resource_pool.summary(),
+                "cooldowns": dict(self.skill_cooldowns),
+            }
+        return dict(self._snap_cache, tags=list(self.tags))
 
 
 class Team:
@@ -157,21 +231,35 @@ class Team:
     def __init__(self, name: str, members: Sequence[Combatant]):
         self.name = name
         self.members = list(members)
+        # Living members in roster order, pruned by :meth:`handle_death`.
+        self._alive_cache: List[Combatant] = [member for member in self.members if member.alive]
+        # Event broadcast after each member's action; :class:`Battle` flips
+        # it to ``ON_ENEMY_ACTION`` for the opposing side.
+        self.action_event = constants.ON_ALLY_ACTION
         for member in self.members:
             member.team = self
 
     def alive_members(self) -> List[Combatant]:
-        return [member for member in self.members if member.alive]
+        """Return the living members.
+
+        The list is shared with the team to keep per-turn queries free of
+        allocations; callers must copy it before mutating. Deaths rebind
+        the cache to a new list, so lists already handed out keep their
+        members while callers iterate them.
+        """
+
+        return self._alive_cache
 
     def handle_death(self, member: Combatant) -> None:
-        for ally in self.alive_members():
+        self._alive_cache = [ally for ally in self._alive_cache if ally is not member]
+        for ally in self._alive_cache:
             ally.event_manager.broadcast(constants.ON_ALLY_DEATH, source=member)
         if self.is_defeated:
             return
 
     @property
     def is_defeated(self) -> bool:
-        return not any(member.alive for member in self.members)
+        return not self._alive_cache
 
 
 # typing imports at bottom to avoid cycles
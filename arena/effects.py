@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from . import constants
 from .events import EventContext, EventManager
 from .stats import DynamicStats
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectInstance:
     """Represents an active status effect on a combatant."""
 
@@ -20,6 +20,13 @@ class EffectInstance:
     modifiers: Dict[str, float] = field(default_factory=dict)
     on_tick: Optional[callable] = None
     on_expire: Optional[callable] = None
+    _modifier_pairs: Tuple[Tuple[str, float], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self) -> None:
+        # Flattened once so applying/removing the effect avoids dict iteration.
+        self._modifier_pairs = tuple(self.modifiers.items())
 
     def tick(self, holder: "Combatant", manager: EventManager) -> None:
         if self.on_tick:
@@ -42,6 +49,8 @@ class EffectController:
         self.stats = stats
         self.manager = manager
         self.effects: Dict[str, EffectInstance] = {}
+        # Incremented whenever effects are added, removed or ticked.
+        self.version = 0
 
     def apply(self, effect: EffectInstance) -> None:
         existing = self.effects.get(effect.name)
@@ -50,8 +59,10 @@ class EffectController:
             existing.duration = max(existing.duration, effect.duration)
         else:
             self.effects[effect.name] = effect
-        for stat, value in effect.modifiers.items():
-            self.stats.apply_modifier(stat, value * effect.stacks)
+        self.version += 1
+        stacks = effect.stacks
+        for stat, value in effect._modifier_pairs:
+            self.stats.apply_modifier(stat, value * stacks)
         self.manager.broadcast(
             constants.ON_APPLY_EFFECT,
             source=self.owner,
@@ -62,8 +73,10 @@ class EffectController:
         effect = self.effects.pop(name, None)
         if not effect:
             return
-        for stat, value in effect.modifiers.items():
-            self.stats.apply_modifier(stat, -value * effect.stacks)
+        self.version += 1
+        stacks = effect.stacks
+        for stat, value in effect._modifier_pairs:
+            self.stats.apply_modifier(stat, -value * stacks)
         self.manager.broadcast(
             constants.ON_REMOVE_EFFECT,
             source=self.owner,
@@ -71,6 +84,7 @@ class EffectController:
         )
 
     def tick_all(self) -> None:
+        self.version += 1
         for effect in list(self.effects.values()):
             effect.tick(self.owner, self.manager)
 
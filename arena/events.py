@@ -13,6 +13,8 @@ engine.
 """
 from __future__ import annotations
 
+import bisect
+import itertools
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Tuple
@@ -20,7 +22,7 @@ from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Tuple
 EventListener = Callable[["EventContext"], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class EventContext:
     """Data object describing the context of a broadcasted battle event.
 
@@ -51,18 +53,23 @@ class EventContext:
         """Create a modified copy of the context.
 
         This helper makes it convenient for listeners to rebroadcast a
-        related event with small changes while preserving immutability of
-        the context passed to the callbacks.
+        related event with small changes. ``targets`` and ``data`` are
+        shared with the original unless overridden, so listeners must
+        replace rather than mutate the inherited containers.
         """
 
-        params = {
-            "name": self.name,
-            "source": self.source,
-            "targets": list(self.targets),
-            "data": dict(self.data),
-        }
-        params.update(overrides)
-        return EventContext(**params)
+        unknown = overrides.keys() - _CONTEXT_FIELDS
+        if unknown:
+            raise TypeError(f"Unknown EventContext fields: {', '.join(sorted(unknown))}")
+        return EventContext(
+            name=overrides.get("name", self.name),
+            source=overrides.get("source", self.source),
+            targets=overrides["targets"] if "targets" in overrides else self.targets,
+            data=overrides["data"] if "data" in overrides else self.data,
+        )
+
+
+_CONTEXT_FIELDS = frozenset({"name", "source", "targets", "data"})
 
 
 class EventManager:
@@ -76,9 +83,14 @@ class EventManager:
     """
 
     def __init__(self) -> None:
-        self._listeners: DefaultDict[str, List[Tuple[int, EventListener]]] = (
+        # Entries are ``(-priority, sequence, listener)`` kept sorted so that
+        # broadcasting walks them in priority order. The sequence number
+        # keeps registration order among equal priorities and guarantees
+        # listeners themselves are never compared.
+        self._listeners: DefaultDict[str, List[Tuple[int, int, EventListener]]] = (
             defaultdict(list)
         )
+        self._sequence = itertools.count()
 
     def register(self, event_name: str, listener: EventListener, *, priority: int = 0) -> None:
         """Register ``listener`` for ``event_name`` with a priority.
@@ -88,23 +100,19 @@ class EventManager:
         overrides might request a different ordering.
         """
 
-        listeners = self._listeners[event_name]
-        listeners.append((priority, listener))
-        listeners.sort(key=lambda item: item[0], reverse=True)
+        bisect.insort(self._listeners[event_name], (-priority, next(self._sequence), listener))
 
     def unregister(self, event_name: str, listener: EventListener) -> None:
         """Remove ``listener`` for ``event_name`` if currently registered."""
 
         listeners = self._listeners[event_name]
         self._listeners[event_name] = [
-            (priority, registered)
-            for priority, registered in listeners
-            if registered is not listener
+            entry for entry in listeners if entry[2] is not listener
         ]
 
     def broadcast(self, event_name: str, *, source: Any | None = None,
                   targets: Iterable[Any] | None = None,
-                  data: Dict[str, Any] | None = None) -> EventContext:
+                  data: Dict[str, Any] | None = None) -> EventContext | None:
         """Notify listeners about ``event_name``.
 
         Parameters
@@ -115,18 +123,27 @@ class EventManager:
             Optional entity responsible for the event.
         targets:
             Optional iterable with the entities affected by the event.
+            Lists are passed to listeners as-is, other iterables are
+            copied into a list.
         data:
-            Optional dictionary with custom payload. Callers can reuse
-            the returned context to avoid allocations.
+            Optional dictionary with custom payload. It is passed to the
+            listeners without copying, so callers must not mutate it
+            after broadcasting.
+
+        Returns the context handed to the listeners, or ``None`` when
+        nobody is listening to ``event_name`` and no context was built.
         """
 
+        listeners = self._listeners.get(event_name)
+        if not listeners:
+            return None
         context = EventContext(
             name=event_name,
             source=source,
-            targets=list(targets or []),
-            data=dict(data or {}),
+            targets=targets if type(targets) is list else list(targets or ()),
+            data=data if data is not None else {},
         )
-        for _, listener in list(self._listeners[event_name]):
+        for _, _, listener in list(listeners):
             listener(context)
         return context
 
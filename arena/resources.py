@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, Optional
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
 
 from . import constants
 from .events import EventManager
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """Configuration of an individual resource bar."""
 
@@ -39,6 +39,8 @@ class ResourcePool:
         self.resources: Dict[str, Resource] = {name: res for name, res in resources.items()}
         self.manager = manager
         self.owner = owner
+        # Incremented whenever a resource value changes through the pool.
+        self.version = 0
         for resource in self.resources.values():
             if resource.gain_on_events:
                 for event_name, amount in resource.gain_on_events.items():
@@ -48,6 +50,7 @@ class ResourcePool:
         def callback(context):
             resource.value += amount
             resource.clamp()
+            self.version += 1
         return callback
 
     def can_pay(self, costs: Mapping[str, float]) -> bool:
@@ -57,6 +60,21 @@ class ResourcePool:
                 return False
         return True
 
+    def can_pay_pairs(self, costs: Sequence[Tuple[str, float]]) -> bool:
+        """Variant of :meth:`can_pay` for pre-flattened ``(name, cost)`` pairs."""
+
+        if not costs:
+            return True
+        if len(costs) == 1:
+            name, cost = costs[0]
+            resource = self.resources.get(name)
+            return resource is not None and resource.value >= cost
+        for name, cost in costs:
+            resource = self.resources.get(name)
+            if not resource or resource.value < cost:
+                return False
+        return True
+
     def pay(self, costs: Mapping[str, float]) -> None:
         for name, cost in costs.items():
             resource = self.resources.get(name)
@@ -64,12 +82,14 @@ class ResourcePool:
                 continue
             resource.value -= cost
             resource.clamp()
+        self.version += 1
 
     def on_turn_start(self) -> None:
         for resource in self.resources.values():
             resource.value += resource.regen_per_turn
             resource.value -= resource.decay_per_turn
             resource.clamp()
+        self.version += 1
 
     def on_turn_end(self) -> None:
         pass
@@ -80,6 +100,7 @@ class ResourcePool:
             return
         resource.value += amount
         resource.clamp()
+        self.version += 1
 
     def summary(self) -> Dict[str, float]:
         return {name: resource.value for name, resource in self.resources.items()}
@@ -0,0 +1,75 @@
+"""Headless batch simulations for balance evaluation.
+
+Balance sweeps need the outcome of many battles rather than their logs,
+so the helpers here replay fresh teams through :class:`Battle` with
+logging disabled and a derived seed per battle. Reusing the real engine
+keeps every rule (events, effects, resources) in play while the seeds
+make a whole batch reproducible.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from .battle import Battle
+from .combatant import Team
+
+TeamFactory = Callable[[], Tuple[Team, Team]]
+
+
+@dataclass
+class BatchResult:
+    """Aggregated outcome of :func:`run_batch`."""
+
+    battles: int = 0
+    team_a_wins: int = 0
+    team_b_wins: int = 0
+    draws: int = 0
+    total_turns: int = 0
+
+    @property
+    def team_a_win_rate(self) -> float:
+        return self.team_a_wins / self.battles if self.battles else 0.0
+
+    @property
+    def team_b_win_rate(self) -> float:
+        return self.team_b_wins / self.battles if self.battles else 0.0
+
+    @property
+    def average_turns(self) -> float:
+        return self.total_turns / self.battles if self.battles else 0.0
+
+
+def run_batch(
+    make_teams: TeamFactory,
+    n_battles: int = 1024,
+    *,
+    max_turns: int = 100,
+    seed: Optional[int] = None,
+) -> BatchResult:
+    """Run ``n_battles`` independent battles and tally the results.
+
+    ``make_teams`` must build brand new teams on every call because
+    combatants keep their state (HP, cooldowns, effects) after a fight.
+    Battles that hit ``max_turns`` with both teams standing count as
+    draws.
+    """
+
+    seeds = random.Random(seed)
+    result = BatchResult()
+    for _ in range(n_battles):
+        team_a, team_b = make_teams()
+        battle = Battle(team_a, team_b, seed=seeds.getrandbits(64), log_enabled=False)
+        battle.run(max_turns=max_turns)
+        result.battles += 1
+        result.total_turns += battle.turn_number
+        a_defeated = team_a.is_defeated
+        b_defeated = team_b.is_defeated
+        if b_defeated and not a_defeated:
+            result.team_a_wins += 1
+        elif a_defeated and not b_defeated:
+            result.team_b_wins += 1
+        else:
+            result.draws += 1
+    return result
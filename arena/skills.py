@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, Optional, Sequence
 
 from . import constants
+from .effects import EffectInstance
 from .events import EventManager
 from .stats import DynamicStats
 
@@ -23,7 +24,7 @@ class Skill:
     tags: Sequence[str] = field(default_factory=list)
     costs: Dict[str, float] = field(default_factory=dict)
 
-    def select_targets(self, user: "Combatant", context: "BattleContext") -> List["Combatant"]:
+    def select_targets(self, user: "Combatant", context: "BattleContext") -> Sequence["Combatant"]:
         raise NotImplementedError
 
     def perform(self, user: "Combatant", targets: Sequence["Combatant"], context: "BattleContext") -> None:
@@ -32,7 +33,8 @@ class Skill:
     def execute(self, user: "Combatant", context: "BattleContext") -> None:
         targets = self.select_targets(user, context)
         user.event_manager.broadcast(constants.ON_USE_SKILL, source=user, data={"skill": self.name})
-        user.resource_pool.pay(self.costs)
+        if self.costs:
+            user.resource_pool.pay(self.costs)
         self.perform(user, targets, context)
         user.start_cooldown(self)
 
@@ -44,20 +46,25 @@ class SingleTargetAttack(Skill):
     power: float = 1.0
     damage_type: str = "physical"
 
-    def select_targets(self, user: "Combatant", context: "BattleContext") -> List["Combatant"]:
-        return [context.pick_enemy_target(user)]
+    def select_targets(self, user: "Combatant", context: "BattleContext") -> Sequence["Combatant"]:
+        return (context.pick_enemy_target(user),)
 
     def perform(self, user: "Combatant", targets: Sequence["Combatant"], context: "BattleContext") -> None:
+        compute_damage = context.compute_damage
+        broadcast = user.event_manager.broadcast
+        power = self.power
+        damage_type = self.damage_type
+        tags = self.tags
         for target in targets:
             if not target:
                 continue
-            damage, is_crit = context.compute_damage(user, target, self.power, self.damage_type, self.tags)
-            target.apply_damage(damage, self.damage_type, source=user, is_critical=is_crit)
-            user.event_manager.broadcast(
+            damage, is_crit = compute_damage(user, target, power, damage_type, tags)
+            target.apply_damage(damage, damage_type, source=user, is_critical=is_crit)
+            broadcast(
                 constants.ON_ATTACK,
                 source=user,
                 targets=[target],
-                data={constants.DMG_AMOUNT: damage, constants.DMG_TYPE: self.damage_type},
+                data={constants.DMG_AMOUNT: damage, constants.DMG_TYPE: damage_type},
             )
 
 
@@ -67,14 +74,15 @@ class HealingSkill(Skill):
 
     amount: float = 50.0
 
-    def select_targets(self, user: "Combatant", context: "BattleContext") -> List["Combatant"]:
-        return [context.pick_ally_to_heal(user)]
+    def select_targets(self, user: "Combatant", context: "BattleContext") -> Sequence["Combatant"]:
+        return (context.pick_ally_to_heal(user),)
 
     def perform(self, user: "Combatant", targets: Sequence["Combatant"], context: "BattleContext") -> None:
         for target in targets:
             if target:
                 healed = target.heal(self.amount, source=user)
-                context.log_event(f"{user.name} cura a {target.name} por {healed:.0f} HP")
+                if context.log_enabled:
+                    context.log_event(f"{user.name} cura a {target.name} por {healed:.0f} HP")
 
 
 @dataclass
@@ -85,12 +93,10 @@ class BuffSkill(Skill):
     amount: float = 20.0
     duration: int = 2
 
-    def select_targets(self, user: "Combatant", context: "BattleContext") -> List["Combatant"]:
-        return [user]
+    def select_targets(self, user: "Combatant", context: "BattleContext") -> Sequence["Combatant"]:
+        return (user,)
 
     def perform(self, user: "Combatant", targets: Sequence["Combatant"], context: "BattleContext") -> None:
-        from .effects import EffectInstance
-
         for target in targets:
             effect = EffectInstance(
                 name=f"buff_{self.stat}",
@@ -98,7 +104,8 @@ class BuffSkill(Skill):
                 modifiers={self.stat: self.amount},
             )
             target.apply_effect(effect)
-            context.log_event(f"{user.name} potencia {self.stat} de {target.name}")
+            if context.log_enabled:
+                context.log_event(f"{user.name} potencia {self.stat} de {target.name}")
 
 
 # typing imports at bottom
@@ -9,10 +9,10 @@ behaviours.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Mapping
+from typing import Dict, List, Mapping, Sequence
 
 
-STAT_NAMES = [
+STAT_NAMES = (
     "hp",
     "atk",
     "mag",
@@ -23,10 +23,13 @@ STAT_NAMES = [
     "speed",
     "accuracy",
     "evasion",
-]
+)
 
+# Position of every stat in the per-entity value vectors.
+STAT_INDEX: Dict[str, int] = {name: index for index, name in enumerate(STAT_NAMES)}
 
-DAMAGE_TYPES = [
+
+DAMAGE_TYPES = (
     "physical",
     "magical",
     "fire",
@@ -34,10 +37,19 @@ DAMAGE_TYPES = [
     "electric",
     "arcane",
     "true",
-]
+)
+
+# Position of every damage type in the per-entity resistance vectors.
+DAMAGE_INDEX: Dict[str, int] = {
+    damage_type: index for index, damage_type in enumerate(DAMAGE_TYPES)
+}
+
+# Keys produced by ``DynamicStats.as_dict`` for the fixed stats and damage
+# types, built once instead of formatting ``res_*`` names on every call.
+_AS_DICT_KEYS = STAT_NAMES + tuple(f"res_{damage_type}" for damage_type in DAMAGE_TYPES)
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     """Immutable container with the core stats of an entity."""
 
@@ -68,24 +80,70 @@ class Stats:
             resistances=dict(self.resistances),
         )
 
+    def to_array(self) -> List[float]:
+        """Return the core stats as floats laid out like ``STAT_NAMES``."""
+        return [float(getattr(self, name)) for name in STAT_NAMES]
+
 
 class DynamicStats:
-    """Tracks current stat values including temporary modifiers."""
+    """Tracks current stat values including temporary modifiers.
+
+    Stats are stored as parallel lists laid out by ``STAT_INDEX``: the base
+    values, the accumulated bonuses and the effective value returned by
+    :meth:`get` (base plus bonus, or the value set by an override).
+    """
 
     def __init__(self, base: Stats) -> None:
-        self.base = base.copy()
-        self.current = base.copy()
-        self.bonus: Dict[str, float] = {name: 0.0 for name in STAT_NAMES}
-        self.resistance_bonus: Dict[str, float] = {
-            damage_type: 0.0 for damage_type in DAMAGE_TYPES
-        }
+        self._base = base.to_array()
+        self._bonus = [0.0] * len(STAT_NAMES)
+        # Effective value of each stat, written by the mutators so reads are
+        # a single list access.
+        self._values = list(self._base)
+        self._resistances: Dict[str, float] = dict(base.resistances)
+        # Resistances to the known damage types follow the same layout,
+        # indexed by ``DAMAGE_INDEX``. Custom types defined by content
+        # packs keep their bonuses in a per-instance dict instead.
+        self._res_base = [float(self._resistances.get(damage_type, 0.0)) for damage_type in DAMAGE_TYPES]
+        self._res_bonus = [0.0] * len(DAMAGE_TYPES)
+        self._res_values = list(self._res_base)
+        self._extra_res_bonus: Dict[str, float] = {}
+        # Incremented by every mutator so observers can cache derived views.
+        self.version = 0
+
+    @property
+    def base(self) -> Stats:
+        """Snapshot of the base stats."""
+        return self._as_stats(self._base)
+
+    @property
+    def current(self) -> Stats:
+        """Snapshot of the effective stats."""
+        return self._as_stats(self._values)
+
+    @property
+    def bonus(self) -> Dict[str, float]:
+        """Snapshot of the accumulated additive bonuses per stat."""
+        return dict(zip(STAT_NAMES, self._bonus))
+
+    @property
+    def resistance_bonus(self) -> Dict[str, float]:
+        """Snapshot of the accumulated resistance bonuses per damage type."""
+        bonuses = dict(zip(DAMAGE_TYPES, self._res_bonus))
+        bonuses.update(self._extra_res_bonus)
+        return bonuses
+
+    def _as_stats(self, values: List[float]) -> Stats:
+        return Stats(**dict(zip(STAT_NAMES, values)), resistances=dict(self._resistances))
 
     def apply_modifier(self, name: str, amount: float) -> None:
         """Apply a temporary additive modifier."""
-        if name not in STAT_NAMES:
+        index = STAT_INDEX.get(name)
+        if index is None:
             raise ValueError(f"Unknown stat {name}")
-        self.bonus[name] += amount
-        self._recalculate(name)
+        bonus = self._bonus[index] + amount
+        self._bonus[index] = bonus
+        self._values[index] = self._base[index] + bonus
+        self.version += 1
 
     def set_override(self, name: str, value: float) -> None:
         """Override the current value for ``name``.
@@ -94,56 +152,92 @@ class DynamicStats:
         without touching the base stats.
         """
 
-        if name not in STAT_NAMES:
+        index = STAT_INDEX.get(name)
+        if index is None:
             raise ValueError(f"Unknown stat {name}")
-        setattr(self.current, name, value)
+        self._values[index] = float(value)
+        self.version += 1
 
     def apply_resistance_modifier(self, damage_type: str, amount: float) -> None:
-        if damage_type not in DAMAGE_TYPES:
-            DAMAGE_TYPES.append(damage_type)
-        self.resistance_bonus[damage_type] = self.resistance_bonus.get(damage_type, 0.0) + amount
+        self.version += 1
+        index = DAMAGE_INDEX.get(damage_type)
+        if index is None:
+            self._extra_res_bonus[damage_type] = self._extra_res_bonus.get(damage_type, 0.0) + amount
+            return
+        bonus = self._res_bonus[index] + amount
+        self._res_bonus[index] = bonus
+        self._res_values[index] = self._res_base[index] + bonus
 
     def get(self, name: str) -> float:
-        return getattr(self.current, name) + self.bonus.get(name, 0.0)
+        return self._values[STAT_INDEX[name]]
+
+    def get_at(self, index: int) -> float:
+        """Return a stat by its ``STAT_INDEX`` position.
+
+        Hot code paths resolve the index once and skip the name lookup.
+        """
+
+        return self._values[index]
 
     def get_resistance(self, damage_type: str) -> float:
-        base = self.current.resistances.get(damage_type, 0.0)
-        return base + self.resistance_bonus.get(damage_type, 0.0)
+        index = DAMAGE_INDEX.get(damage_type)
+        if index is not None:
+            return self._res_values[index]
+        base = self._resistances.get(damage_type, 0.0)
+        return base + self._extra_res_bonus.get(damage_type, 0.0)
 
     def as_dict(self) -> Dict[str, float]:
-        values = {name: self.get(name) for name in STAT_NAMES}
-        for damage_type in DAMAGE_TYPES:
+        values = dict(zip(_AS_DICT_KEYS, self._values + self._res_values))
+        for damage_type in self._extra_res_bonus:
             values[f"res_{damage_type}"] = self.get_resistance(damage_type)
         return values
 
     def refresh(self) -> None:
         """Recalculate all stats from base + bonus."""
-        for name in STAT_NAMES:
-            self._recalculate(name)
+        self._values = [base + bonus for base, bonus in zip(self._base, self._bonus)]
+        self.version += 1
 
-    def _recalculate(self, name: str) -> None:
-        setattr(self.current, name, getattr(self.base, name) + self.bonus.get(name, 0.0))
+    def update_from(self, other: Mapping[str, float] | Sequence[float]) -> None:
+        """Bulk update modifiers from a mapping.
 
-    def update_from(self, other: Mapping[str, float]) -> None:
-        """Bulk update modifiers from a mapping."""
+        A sequence with one value per entry of ``STAT_NAMES`` replaces every
+        effective stat at once.
+        """
+        if not isinstance(other, Mapping):
+            if len(other) != len(STAT_NAMES):
+                raise ValueError(f"Expected {len(STAT_NAMES)} stat values, got {len(other)}")
+            self._values = [float(value) for value in other]
+            self.version += 1
+            return
+        values = self._values
         for key, value in other.items():
-            if key in STAT_NAMES:
-                self.set_override(key, value)
+            index = STAT_INDEX.get(key)
+            if index is not None:
+                values[index] = float(value)
+        self.version += 1
 
     def scale(self, factors: Mapping[str, float]) -> None:
         """Multiply stats by provided factors.
 
         Useful for transformations that scale several attributes at once.
         """
+        values = self._values
         for key, factor in factors.items():
-            if key in STAT_NAMES:
-                self.set_override(key, getattr(self.current, key) * factor)
+            index = STAT_INDEX.get(key)
+            if index is not None:
+                values[index] *= factor
+        self.version += 1
 
 
-def combine_resistances(*resistance_maps: Iterable[Mapping[str, float]]) -> Dict[str, float]:
+def combine_resistances(*resistance_maps: Mapping[str, float]) -> Dict[str, float]:
     """Merge multiple resistance dictionaries using addition."""
-    merged: Dict[str, float] = {}
-    for mapping in resistance_maps:
+    if not resistance_maps:
+        return {}
+    # The first mapping is copied in C; only the remaining ones need the
+    # per-key accumulation loop.
+    merged: Dict[str, float] = dict(resistance_maps[0])
+    get = merged.get
+    for mapping in resistance_maps[1:]:
         for damage_type, value in mapping.items():
-            merged[damage_type] = merged.get(damage_type, 0.0) + value
+            merged[damage_type] = get(damage_type, 0.0) + value
     return merged
@@ -2,37 +2,83 @@
 from __future__ import annotations
 
 import heapq
-from dataclasses import dataclass, field
-from typing import List
+from typing import Iterable, List, NamedTuple
 
+from .stats import STAT_INDEX
 
-@dataclass(order=True)
-class TimelineEntry:
-    """Represents a combatant scheduled to act."""
+_SPEED = STAT_INDEX["speed"]
+
+
+def _action_delay(speed: float) -> float:
+    """Time a combatant with ``speed`` waits between two actions."""
+    # Plain comparisons avoid the generic ``max()`` call overhead.
+    delay = 100.0 / speed if speed > 1.0 else 100.0
+    return delay if delay > 1.0 else 1.0
+
+
+class TimelineEntry(NamedTuple):
+    """Represents a combatant scheduled to act.
+
+    Being a tuple, entries are compared by the heap in C and carry no
+    per-instance ``__dict__`` (``NamedTuple`` declares empty slots).
+    Counters are unique, so ordering is decided by ``(ready_at, counter)``
+    and the combatant itself is never compared.
+    """
 
     ready_at: float
     counter: int
-    combatant: "Combatant" = field(compare=False)
+    combatant: "Combatant"
 
 
 class Timeline:
-    """Manages initiative order based on speed."""
+    """Manages initiative order based on speed.
+
+    Entries live in a binary heap ordered by ``(ready_at, counter)`` so
+    scheduling and popping the next actor are ``O(log n)``. The monotonic
+    counter breaks ties between combatants ready at the same time in the
+    order they were scheduled.
+    """
 
     def __init__(self) -> None:
         self.queue: List[TimelineEntry] = []
         self.counter = 0
 
     def add_combatant(self, combatant: "Combatant", *, current_time: float = 0.0) -> None:
-        speed = combatant.dynamic_stats.get("speed")
-        ready_at = current_time + max(1.0, 100.0 / max(speed, 1.0))
+        ready_at = current_time + _action_delay(combatant.dynamic_stats.get_at(_SPEED))
         heapq.heappush(self.queue, TimelineEntry(ready_at, self.counter, combatant))
         self.counter += 1
 
+    def add_many(self, combatants: Iterable["Combatant"], *, current_time: float = 0.0) -> None:
+        """Schedule several combatants at once.
+
+        Entries are appended in order and the heap is rebuilt with a single
+        ``heapify`` (``O(n)``) instead of one push per combatant. Each ready
+        time is read before the next combatant is requested, so a lazy
+        iterable sees every earlier combatant already scheduled.
+        """
+
+        queue = self.queue
+        for combatant in combatants:
+            ready_at = current_time + _action_delay(combatant.dynamic_stats.get_at(_SPEED))
+            queue.append(TimelineEntry(ready_at, self.counter, combatant))
+            self.counter += 1
+        heapq.heapify(queue)
+
     def pop_next(self) -> tuple[float, "Combatant"]:
+        """Pop the next living combatant.
+
+        Combatants that died while waiting are discarded lazily here rather
+        than searched for in the heap when they die.
+        """
+
         entry = heapq.heappop(self.queue)
+        while not entry.combatant.alive and self.queue:
+            entry = heapq.heappop(self.queue)
         return entry.ready_at, entry.combatant
 
     def schedule_next(self, combatant: "Combatant", *, current_time: float) -> None:
+        if not combatant.alive:
+            return
         self.add_combatant(combatant, current_time=current_time)
 
     def is_empty(self) -> bool:
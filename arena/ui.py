@@ -1,7 +1,7 @@
 """Text-mode helpers representing the combat UI."""
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Dict, Iterable, Iterator
 
 from .combatant import Combatant
 
@@ -9,24 +9,27 @@ from .combatant import Combatant
 def format_stats_window(combatant: Combatant) -> str:
     """Return a formatted string representing the stats window."""
 
-    snapshot = combatant.snapshot()
-    lines = [f"=== {snapshot['name']} ===", f"HP: {snapshot['hp']:.0f}/{snapshot['max_hp']:.0f}"]
-    lines.append("-- Stats --")
+    return "\n".join(_iter_stats_lines(combatant.snapshot()))
+
+
+def _iter_stats_lines(snapshot: Dict[str, Any]) -> Iterator[str]:
+    yield f"=== {snapshot['name']} ==="
+    yield f"HP: {snapshot['hp']:.0f}/{snapshot['max_hp']:.0f}"
+    yield "-- Stats --"
     for name, value in snapshot["stats"].items():
-        lines.append(f"{name}: {value:.2f}")
-    lines.append("-- Effects --")
+        yield f"{name}: {value:.2f}"
+    yield "-- Effects --"
     if snapshot["effects"]:
         for effect, data in snapshot["effects"].items():
-            lines.append(f"{effect} (dur {data['duration']} st {data['stacks']})")
+            yield f"{effect} (dur {data['duration']} st {data['stacks']})"
     else:
-        lines.append("None")
-    lines.append("-- Resources --")
+        yield "None"
+    yield "-- Resources --"
     for name, value in snapshot["resources"].items():
-        lines.append(f"{name}: {value:.1f}")
-    lines.append("-- Cooldowns --")
+        yield f"{name}: {value:.1f}"
+    yield "-- Cooldowns --"
     for name, value in snapshot["cooldowns"].items():
-        lines.append(f"{name}: {value}")
-    return "\n".join(lines)
+        yield f"{name}: {value}"
 
 
 def format_log(log: Iterable[str]) -> str:
@@ -7,19 +7,33 @@ def calcular_margen(precio, lote, apalancamiento, tamaño_lote_base=100):
     margen = valor_nominal / apalancamiento
     return valor_nominal, margen
 
+# Plantilla del resultado, construida una sola vez
+PLANTILLA_RESULTADO = "📊 Valor nominal: ${:,.2f}\n💰 Margen requerido: ${:,.2f}"
+
+# Último texto mostrado, para no reconfigurar la etiqueta si no cambia
+ultimo_resultado = None
+
+# Función que muestra el resultado en la etiqueta
+def mostrar_resultado(texto):
+    global ultimo_resultado
+    if texto == ultimo_resultado:
+        return
+    ultimo_resultado = texto
+    label_resultado.config(text=texto)
+
 # Función que se ejecuta al presionar el botón
 def calcular():
     try:
-        precio = float(entry_precio.get())
-        lote = float(entry_lote.get())
-        apalancamiento = float(entry_apalancamiento.get())
-        tamaño_lote_base = float(entry_tamaño_lote_base.get())
+        precio = float(obtener_precio())
+        lote = float(obtener_lote())
+        apalancamiento = float(obtener_apalancamiento())
+        tamaño_lote_base = float(obtener_tamaño_lote_base())
 
         valor_nominal, margen = calcular_margen(precio, lote, apalancamiento, tamaño_lote_base)
 
-        label_resultado.config(
-            text=f"📊 Valor nominal: ${valor_nominal:,.2f}\n💰 Margen requerido: ${margen:,.2f}"
-        )
+        texto = PLANTILLA_RESULTADO.format(valor_nominal, margen)
+        # Actualizar la etiqueta cuando Tk esté inactivo
+        root.after_idle(mostrar_resultado, texto)
     except ValueError:
         messagebox.showerror("Error", "Por favor ingresa valores numéricos válidos")
 
@@ -45,6 +59,12 @@ tk.Label(root, text="Tamaño base del lote:").pack()
 entry_tamaño_lote_base = tk.Entry(root)
 entry_tamaño_lote_base.pack()
 
+# Métodos de lectura de cada entrada, resueltos una sola vez
+obtener_precio = entry_precio.get
+obtener_lote = entry_lote.get
+obtener_apalancamiento = entry_apalancamiento.get
+obtener_tamaño_lote_base = entry_tamaño_lote_base.get
+
 # Botón para calcular
 tk.Button(root, text="Calcular Margen", command=calcular).pack(pady=10)
 